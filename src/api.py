@@ -1,16 +1,26 @@
 from __future__ import annotations
 
-import os
+import hmac
 import traceback
 from contextlib import asynccontextmanager
-from io import BytesIO
 from typing import Optional
+from urllib.parse import quote
 
 from loguru import logger
-from PIL import Image
 
-from fastapi import Depends, FastAPI, File, Form, HTTPException, Header, UploadFile
+from fastapi import (
+    Depends,
+    FastAPI,
+    File,
+    Form,
+    HTTPException,
+    Header,
+    Query,
+    Request,
+    UploadFile,
+)
 from fastapi.responses import Response
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.config import settings
 from src.google_translate_browser import (
@@ -19,6 +29,7 @@ from src.google_translate_browser import (
     stop_browser_pool,
     translate_image_google_async,
 )
+from src.image_format import infer_format_ext_media
 
 
 @asynccontextmanager
@@ -33,88 +44,164 @@ async def lifespan(app: FastAPI):
 
 app = FastAPI(title="Image Translate Service", version="0.1.0", lifespan=lifespan)
 DEBUG_ERRORS = settings.debug_errors
+HEADLESS = settings.headless
+_API_KEY_BYTES = settings.api_key.encode() if settings.api_key else None
+MAX_UPLOAD_BYTES = settings.max_upload_bytes
+UPLOAD_CHUNK_SIZE = 64 * 1024
+# Base64 inflates by 4/3; leave headroom for a data URL prefix and line breaks.
+MAX_BASE64_CHARS = MAX_UPLOAD_BYTES * 4 // 3 + 1024
 
 
 async def verify_api_key(x_api_key: Optional[str] = Header(default=None)) -> None:
-    """Verify API key if one is configured."""
-    if settings.api_key is None:
-        return
-    if x_api_key != settings.api_key:
+    """Verify the API key in constant time."""
+    if x_api_key is None or not hmac.compare_digest(
+        x_api_key.encode(), _API_KEY_BYTES
+    ):
         raise HTTPException(status_code=401, detail="Invalid or missing API key")
 
 
-def _infer_format(image_bytes: bytes) -> str:
-    try:
-        with Image.open(BytesIO(image_bytes)) as img:
-            return (img.format or "").lower()
-    except Exception:
-        return ""
-
-
-def _infer_extension(image_bytes: bytes) -> str:
-    fmt = _infer_format(image_bytes)
-    if fmt == "jpeg":
-        return ".jpg"
-    if fmt:
-        return f".{fmt}"
-    return ".png"
-
-
-def _infer_media_type(image_bytes: bytes) -> str:
-    fmt = _infer_format(image_bytes)
-    if fmt == "jpeg":
-        return "image/jpeg"
-    if fmt == "png":
-        return "image/png"
-    if fmt == "gif":
-        return "image/gif"
-    if fmt == "bmp":
-        return "image/bmp"
-    if fmt == "webp":
-        return "image/webp"
-    return "application/octet-stream"
+# Only attach the API key check when a key is configured.
+AUTH_DEPENDENCIES = [Depends(verify_api_key)] if _API_KEY_BYTES is not None else []
+
+
+# Map common unicode spaces/dashes/quotes to ASCII and drop characters that
+# are problematic in filenames or headers (including CR/LF and other control
+# characters), in a single ``str.translate`` pass.
+_SANITIZE_TABLE = str.maketrans(
+    {
+        **dict.fromkeys([*range(32), 0x7F]),
+        "\u202f": " ",  # narrow no-break space
+        "\u00a0": " ",  # non-breaking space
+        "\u2013": "-",  # en dash
+        "\u2014": "-",  # em dash
+        "\u2018": "'",  # left single quote
+        "\u2019": "'",  # right single quote
+        "\u201c": None,  # left double quote
+        "\u201d": None,  # right double quote
+        '"': None,
+        "\\": None,
+    }
+)
 
 
 def _sanitize_filename(name: str) -> str:
     """Sanitize filename to ASCII-safe characters for HTTP headers."""
-    # Replace common unicode spaces/dashes with ASCII equivalents
-    replacements = {
-        '\u202f': ' ',  # narrow no-break space
-        '\u00a0': ' ',  # non-breaking space
-        '\u2013': '-',  # en dash
-        '\u2014': '-',  # em dash
-        '\u2018': "'",  # left single quote
-        '\u2019': "'",  # right single quote
-        '\u201c': '"',  # left double quote
-        '\u201d': '"',  # right double quote
-    }
-    for unicode_char, ascii_char in replacements.items():
-        name = name.replace(unicode_char, ascii_char)
-    
+    if (
+        name.isascii()
+        and name.isprintable()
+        and '"' not in name
+        and "\\" not in name
+    ):
+        return name.strip() or "file"
+    name = name.translate(_SANITIZE_TABLE)
     # Remove any remaining non-ASCII characters
-    name = name.encode('ascii', 'ignore').decode('ascii')
-    
-    # Remove any characters that are problematic in filenames
-    name = ''.join(c for c in name if c not in '"\\')
-    
+    name = name.encode("ascii", "ignore").decode("ascii")
     return name.strip() or "file"
 
 
-def _output_filename(original_name: Optional[str], image_bytes: bytes) -> str:
-    ext = _infer_extension(image_bytes)
+def _output_filenames(original_name: Optional[str], ext: str) -> tuple[str, str]:
+    """Return the ``(ascii_fallback, original)`` names for the translated image."""
     if original_name:
-        base = os.path.splitext(os.path.basename(original_name))[0]
-        base = _sanitize_filename(base)
-        return f"{base}_translated{ext}"
-    return f"translated{ext}"
+        # Strip any client-side directory (POSIX or Windows) and the extension.
+        start = max(original_name.rfind("/"), original_name.rfind("\\")) + 1
+        dot = original_name.rfind(".", start)
+        base = original_name[start:dot] if dot > start else original_name[start:]
+        base = base.strip() or "file"
+        # Sanitize the base alone so a fully non-ASCII name still falls back
+        # to "file_translated.png" rather than "_translated.png".
+        return f"{_sanitize_filename(base)}_translated{ext}", f"{base}_translated{ext}"
+    filename = f"translated{ext}"
+    return filename, filename
+
+
+CONTENT_DISPOSITION_TEMPLATE = 'attachment; filename="{}"'
+CONTENT_DISPOSITION_UTF8_TEMPLATE = "attachment; filename=\"{}\"; filename*=UTF-8''{}"
+
+
+def _content_disposition(fallback: str, filename: str) -> str:
+    """Build a Content-Disposition header, adding an RFC 5987 name if needed."""
+    if fallback == filename:
+        return CONTENT_DISPOSITION_TEMPLATE.format(filename)
+    return CONTENT_DISPOSITION_UTF8_TEMPLATE.format(fallback, quote(filename, safe=""))
+
+
+async def _read_upload(file: UploadFile) -> memoryview:
+    """Read an upload in bounded chunks, rejecting it once it exceeds the limit.
+
+    The buffer is returned as a ``memoryview`` so it is handed to the browser
+    driver without another full copy.
+    """
+    if file.size is not None and file.size > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail="Uploaded file is too large.")
+
+    buf = bytearray()
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        buf.extend(chunk)
+        if len(buf) > MAX_UPLOAD_BYTES:
+            raise HTTPException(status_code=413, detail="Uploaded file is too large.")
+    return memoryview(buf)
+
+
+async def _read_raw_body(request: Request) -> memoryview:
+    """Read a raw request body in chunks with the same size limit as uploads."""
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail="Uploaded file is too large.")
+
+    buf = bytearray()
+    async for chunk in request.stream():
+        buf.extend(chunk)
+        if len(buf) > MAX_UPLOAD_BYTES:
+            raise HTTPException(status_code=413, detail="Uploaded file is too large.")
+    return memoryview(buf)
+
+
+async def _translate_response(
+    original_name: Optional[str],
+    timeout_ms: int,
+    *,
+    image_bytes: Optional[bytes | memoryview] = None,
+    image_base64: Optional[str] = None,
+) -> Response:
+    try:
+        output_bytes = await translate_image_google_async(
+            image_bytes=image_bytes,
+            image_base64=image_base64,
+            headless=HEADLESS,
+            timeout_ms=timeout_ms,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except TranslationUiError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    except Exception as exc:
+        if DEBUG_ERRORS:
+            logger.exception("Translate failed")
+            detail = f"{exc}\n{traceback.format_exc()}"
+        else:
+            logger.error(f"Translate failed: {exc!r}")
+            detail = str(exc)
+        raise HTTPException(status_code=500, detail=detail) from exc
+
+    _, ext, media_type = infer_format_ext_media(output_bytes)
+    fallback, filename = _output_filenames(original_name, ext)
+
+    return Response(
+        content=output_bytes,
+        media_type=media_type,
+        headers={"Content-Disposition": _content_disposition(fallback, filename)},
+    )
+
+
+HEALTH_RESPONSE_BODY = b'{"status":"ok"}'
 
 
 @app.get("/health")
-def health() -> dict:
-    return {"status": "ok"}
+async def health() -> Response:
+    return Response(content=HEALTH_RESPONSE_BODY, media_type="application/json")
 
 
-@app.post("/translate", dependencies=[Depends(verify_api_key)])
+@app.post("/translate", dependencies=AUTH_DEPENDENCIES)
 async def translate(
     file: Optional[UploadFile] = File(default=None),
     timeout_ms: int = Form(default=90000),
@@ -125,38 +212,51 @@ async def translate(
     image_bytes = None
 
     if file is not None:
-        image_bytes = await file.read()
+        image_bytes = await _read_upload(file)
         if not image_bytes:
             raise HTTPException(status_code=400, detail="Uploaded file is empty.")
 
-    try:
-        output_bytes = await translate_image_google_async(
-            image_bytes=image_bytes,
-            headless=settings.headless,
-            timeout_ms=timeout_ms,
-        )
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except TranslationUiError as exc:
-        raise HTTPException(status_code=422, detail=str(exc)) from exc
-    except Exception as exc:
-        logger.exception("Translate failed")
-        detail = str(exc)
-        if DEBUG_ERRORS:
-            detail = f"{detail}\n{traceback.format_exc()}"
-        raise HTTPException(status_code=500, detail=detail) from exc
+    return await _translate_response(
+        file.filename if file else None, timeout_ms, image_bytes=image_bytes
+    )
 
-    media_type = _infer_media_type(output_bytes)
-    filename = _output_filename(file.filename if file else None, output_bytes)
 
-    return Response(
-        content=output_bytes,
-        media_type=media_type,
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+@app.post("/translate/raw", dependencies=AUTH_DEPENDENCIES)
+async def translate_raw(
+    request: Request,
+    timeout_ms: int = Query(default=90000),
+    filename: Optional[str] = Query(default=None),
+) -> Response:
+    """Translate an image sent as the raw request body, skipping multipart parsing."""
+    image_bytes = await _read_raw_body(request)
+    if not image_bytes:
+        raise HTTPException(status_code=400, detail="Request body is empty.")
+
+    return await _translate_response(filename, timeout_ms, image_bytes=image_bytes)
+
+
+class Base64Request(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    image_base64: str = Field(min_length=1, max_length=MAX_BASE64_CHARS)
+    timeout_ms: int = 90000
+    filename: Optional[str] = None
+
+
+@app.post("/translate/base64", dependencies=AUTH_DEPENDENCIES)
+async def translate_base64(payload: Base64Request) -> Response:
+    return await _translate_response(
+        payload.filename, payload.timeout_ms, image_base64=payload.image_base64
     )
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("src.api:app", host="0.0.0.0", port=8000, reload=True)
+    uvicorn.run(
+        "src.api:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=settings.workers,
+        reload=settings.reload,
+    )
@@ -12,6 +12,7 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     debug_errors: bool = Field(default=False, validation_alias="DEBUG_ERRORS")
@@ -21,6 +22,7 @@ class Settings(BaseSettings):
     )
     work_dir: Path = Field(default=Path("works"), validation_alias="WORK_DIR")
     headless: bool = Field(default=True, validation_alias="HEADLESS")
+    bot_evasion_mode: bool = Field(default=False, validation_alias="BOT_EVASION_MODE")
     natural_delay_min_s: float = Field(
         default=1.0, validation_alias="NATURAL_DELAY_MIN_S"
     )
@@ -29,6 +31,12 @@ class Settings(BaseSettings):
     )
     api_key: Optional[str] = Field(default=None, validation_alias="API_KEY")
     browser_pool_size: int = Field(default=2, validation_alias="BROWSER_POOL_SIZE")
+    max_upload_bytes: int = Field(
+        default=20 * 1024 * 1024, validation_alias="MAX_UPLOAD_BYTES"
+    )
+    # Each worker launches its own Chromium with BROWSER_POOL_SIZE contexts.
+    workers: int = Field(default=1, validation_alias="WORKERS")
+    reload: bool = Field(default=False, validation_alias="RELOAD")
 
 
 settings = Settings()
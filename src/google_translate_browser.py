@@ -8,40 +8,107 @@ https://translate.google.com/?sl=auto&tl=en&op=images
 from __future__ import annotations
 
 import asyncio
-import base64
 import binascii
-import os
 import random
 import re
-import tempfile
+import threading
 import time
 from contextlib import asynccontextmanager
 from io import BytesIO
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterable, Optional, Sequence
 
 from loguru import logger
 from PIL import Image
 
-from playwright.async_api import Browser, BrowserContext, Playwright
+from playwright.async_api import Browser, Page, Playwright
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from playwright.async_api import async_playwright
 
 from src.config import settings
+from src.image_format import FORMAT_TABLE, infer_format
 
 DEFAULT_TIMEOUT_MS = 90000
 
+IMAGE_TRANSLATE_URL = "https://translate.google.com/?sl=auto&tl=en&op=images"
+TRANSLATE_HOME_URL = "https://translate.google.com/"
+IMAGES_URL_RE = re.compile(r"[?&]op=images")
+
+# Selector entries are (css, text) pairs for _click_first_visible: text is a
+# case-insensitive match on the element's text or aria-label, standing in for
+# Playwright's :has-text() and accessible-name matching.
+CONSENT_SELECTORS = (
+    ("button", "Accept all"),
+    ("button", "I agree"),
+    ("button", "Agree"),
+    ("button", "Accept"),
+    ("#introAgreeButton", None),
+    ("button[aria-label='Accept all']", None),
+)
+IMAGES_TAB_SELECTORS = (
+    ("[role='tab']", "images"),
+    ("button, [role='button']", "image translation"),
+    ("button, [role='button']", "images"),
+    ("button[aria-label='Image translation']", None),
+    ("[data-value='images']", None),
+    ("a[href*='op=images']", None),
+)
+DOWNLOAD_SELECTORS = (
+    ("button", "Download"),
+    ("a", "Download"),
+    ("button[aria-label*='Download']", None),
+    ("a[aria-label*='Download']", None),
+    ("[role='button']", "download"),
+)
+# A matched download button is already visible, so a click that stalls means it
+# was re-rendered away; fall back to the image instead of waiting out the budget.
+DOWNLOAD_CLICK_TIMEOUT_MS = 5000
+TRANSLATED_IMG_SELECTOR = (
+    "img[alt*='Translated' i], img[aria-label*='translation' i], img[aria-label*='translated' i]"
+)
+READY_OR_CONSENT_SELECTOR = "input[type=file], form[action*='consent'], #introAgreeButton"
+TRANSLATION_ERROR_MESSAGES = (
+    "Can't detect text",
+    "Cannot detect text",
+    "This language may not be supported",
+)
+
+# File input ``accept`` tokens used to prefer the image upload over documents.
+IMAGE_ACCEPT_TOKENS = ("image", ".png", ".jpg", ".jpeg", ".webp", ".bmp", ".gif")
+DEPRIORITIZED_ACCEPT_TOKENS = (".pdf", ".pptx", ".docx", ".xlsx", "application/pdf")
+
+# Analytics beacons and webfonts that the image translation flow does not need.
+# translate.googleapis.com and the image hosts must never match.
+BLOCKED_URL_PATTERNS = [
+    "*doubleclick.net*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*fonts.gstatic.com*",
+    "*/gen_204*",
+    "*.woff*",
+]
+# Pillow only needs the leading header to identify a format. 64 KiB also covers
+# a full JPEG APPn (e.g. EXIF) segment ahead of the frame header.
+FORMAT_SNIFF_BYTES = 64 * 1024
+# Unknown uploads are sent as PNG, matching the ".png" name they are given.
+DEFAULT_UPLOAD_FORMAT = (".png", "image/png")
+
 
 class BrowserPool:
-    """Pool of reusable Chromium browser contexts."""
+    """Pool of reusable Chromium pages parked on the image translate UI.
+
+    Each slot is its own browser context with a single page that has already
+    opened the images tab and dismissed consent, so a translation only has to
+    upload, wait and download. Pages are re-parked in the background after use.
+    """
 
     def __init__(self, pool_size: int = 2, headless: bool = True):
         self._pool_size = pool_size
         self._headless = headless
         self._playwright: Optional[Playwright] = None
         self._browser: Optional[Browser] = None
-        self._available: asyncio.Queue[BrowserContext] = asyncio.Queue()
-        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._available: asyncio.Queue[Page] = asyncio.Queue()
+        self._recycling: set[asyncio.Task] = set()
         self._initialized = False
         self._lock = asyncio.Lock()
 
@@ -51,7 +118,7 @@ class BrowserPool:
             if self._initialized:
                 return
 
-            logger.info(f"Starting browser pool with {self._pool_size} contexts")
+            logger.info(f"Starting browser pool with {self._pool_size} pages")
             self._playwright = await async_playwright().start()
 
             use_tor = settings.tor_enabled
@@ -63,14 +130,14 @@ class BrowserPool:
 
             launch_options = _build_launch_options(self._headless, proxy_server)
             self._browser = await self._playwright.chromium.launch(**launch_options)
-            self._semaphore = asyncio.Semaphore(self._pool_size)
 
-            # Pre-create contexts
-            for _ in range(self._pool_size):
-                context = await self._browser.new_context(
-                    accept_downloads=True, locale="en-US"
-                )
-                await self._available.put(context)
+            # Pre-create pages and park them in the background so startup does
+            # not wait on reaching Google.
+            pages = await asyncio.gather(
+                *(self._new_page() for _ in range(self._pool_size))
+            )
+            for page in pages:
+                self._spawn(self._park(page))
 
             self._initialized = True
             logger.info("Browser pool started")
@@ -83,11 +150,15 @@ class BrowserPool:
 
             logger.info("Stopping browser pool")
 
+            for task in list(self._recycling):
+                task.cancel()
+            await asyncio.gather(*self._recycling, return_exceptions=True)
+
             # Close all contexts
             while not self._available.empty():
                 try:
-                    context = self._available.get_nowait()
-                    await context.close()
+                    page = self._available.get_nowait()
+                    await page.context.close()
                 except Exception:
                     pass
 
@@ -104,34 +175,68 @@ class BrowserPool:
 
     @asynccontextmanager
     async def acquire(self):
-        """Acquire a browser context from the pool."""
+        """Acquire a page from the pool, parked unless parking failed."""
         if not self._initialized:
             await self.start()
 
-        await self._semaphore.acquire()
-        context = None
+        page = await self._available.get()
         try:
-            context = await self._available.get()
-            yield context
+            yield page
         finally:
-            if context:
-                # Clean up: close all pages and return context to pool
+            self._spawn(self._recycle(page))
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._recycling.add(task)
+        task.add_done_callback(self._recycling.discard)
+
+    async def _new_page(self) -> Page:
+        context = await self._browser.new_context(accept_downloads=True, locale="en-US")
+        page = await context.new_page()
+        # Block through CDP rather than context.route: any Playwright route
+        # intercepts every request and disables the HTTP cache, which would make
+        # each recycle re-download Google Translate's bundles.
+        try:
+            cdp = await context.new_cdp_session(page)
+            await cdp.send("Network.enable")
+            await cdp.send("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.warning(f"Failed to block tracking resources: {e}")
+        return page
+
+    async def _park(self, page: Page) -> None:
+        """Open the images tab on ``page`` and return it to the pool."""
+        try:
+            await _open_image_translate(page, DEFAULT_TIMEOUT_MS)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Hand it out unparked; translate_image_google_async re-opens it on use.
+            logger.warning(f"Failed to park page on image translate: {e}")
+        await self._available.put(page)
+
+    async def _recycle(self, page: Page) -> None:
+        """Re-park a used page on a fresh images tab and return it to the pool."""
+        try:
+            if page.is_closed():
+                # The page went down with its context; replace the slot.
                 try:
-                    for page in context.pages:
-                        await page.close()
-                    await self._available.put(context)
-                except Exception as e:
-                    logger.warning(f"Error returning context to pool: {e}")
-                    # Create a fresh context if the old one is broken
-                    try:
-                        if self._browser:
-                            new_context = await self._browser.new_context(
-                                accept_downloads=True, locale="en-US"
-                            )
-                            await self._available.put(new_context)
-                    except Exception:
-                        pass
-            self._semaphore.release()
+                    await page.context.close()
+                except Exception:
+                    pass
+                page = await self._new_page()
+            else:
+                for other in page.context.pages:
+                    if other is not page:
+                        await other.close()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Error returning page to pool: {e}")
+            if page.is_closed():
+                return
+
+        await self._park(page)
 
 
 # Global browser pool instance
@@ -161,11 +266,7 @@ async def stop_browser_pool() -> None:
     if _browser_pool:
         await _browser_pool.stop()
         _browser_pool = None
-TRANSLATION_ERROR_MESSAGES = (
-    "Can't detect text",
-    "Cannot detect text",
-    "This language may not be supported",
-)
+
 
 def _build_launch_options(headless: bool, proxy_server: Optional[str]) -> dict:
     launch_options = {
@@ -197,40 +298,37 @@ def _normalize_base64(data: str) -> bytes:
             raise ValueError("Invalid data URL for base64 input.")
         value = parts[1]
 
-    value = "".join(value.split())
+    try:
+        encoded = value.encode("ascii")
+    except UnicodeEncodeError as exc:
+        raise ValueError("Base64 input contains non-ASCII characters.") from exc
+    encoded = encoded.translate(None, b" \t\n\r\x0b\x0c")
 
-    missing_padding = len(value) % 4
+    missing_padding = len(encoded) % 4
     if missing_padding:
-        value += "=" * (4 - missing_padding)
+        encoded += b"=" * (4 - missing_padding)
 
-    try:
-        return base64.b64decode(value, validate=True)
-    except binascii.Error:
-        return base64.b64decode(value)
+    # a2b_base64 is non-strict: stray non-alphabet characters are skipped.
+    return binascii.a2b_base64(encoded)
 
 
-def _infer_suffix(image_bytes: bytes) -> str:
-    try:
-        with Image.open(BytesIO(image_bytes)) as img:
-            fmt = (img.format or "").lower()
-    except Exception:
-        fmt = ""
+def _infer_upload_format(image_bytes: bytes | memoryview) -> tuple[str, str]:
+    """Return the ``(suffix, mime_type)`` to upload ``image_bytes`` with."""
+    fmt = infer_format(image_bytes)
+    if not fmt:
+        # Fall back to Pillow for less common formats.
+        try:
+            with Image.open(BytesIO(image_bytes[:FORMAT_SNIFF_BYTES])) as img:
+                fmt = (img.format or "").lower()
+        except Exception:
+            fmt = ""
 
-    if fmt == "jpeg":
-        return ".jpg"
+    if fmt in FORMAT_TABLE:
+        return FORMAT_TABLE[fmt]
     if fmt:
-        return f".{fmt}"
-    return ".png"
-
-
-def _write_temp_image(image_bytes: bytes) -> str:
-    suffix = _infer_suffix(image_bytes)
-    work_dir = Path(settings.work_dir)
-    work_dir.mkdir(parents=True, exist_ok=True)
-    fd, path = tempfile.mkstemp(prefix="gt_image_", suffix=suffix, dir=str(work_dir))
-    with os.fdopen(fd, "wb") as handle:
-        handle.write(image_bytes)
-    return path
+        # Keep an image type for Pillow-only formats so the upload UI accepts them.
+        return f".{fmt}", Image.MIME.get(fmt.upper(), DEFAULT_UPLOAD_FORMAT[1])
+    return DEFAULT_UPLOAD_FORMAT
 
 
 def _resolve_work_path(path_value: str) -> str:
@@ -246,6 +344,9 @@ def _resolve_work_path(path_value: str) -> str:
 
 
 async def _natural_delay() -> None:
+    """Sleep a random human-like interval, only in bot evasion mode."""
+    if not settings.bot_evasion_mode:
+        return
     delay_min = max(0.0, settings.natural_delay_min_s)
     delay_max = max(delay_min, settings.natural_delay_max_s)
     if delay_max <= 0:
@@ -266,75 +367,122 @@ async def _capture_error_screenshot(page, label: str) -> Optional[str]:
         return None
 
 
-async def _has_image_file_input(page) -> bool:
-    handles = await page.query_selector_all("input[type=file]")
-    if not handles:
-        return False
+async def _probe_file_inputs(page) -> tuple[bool, bool]:
+    """Return ``(found, has_image_input)`` for the page's file inputs.
+
+    The choice is made in-page in one round trip and cached on ``window``
+    until a MutationObserver sees file inputs change. The chosen input is
+    tagged with a ``data-gt-file-input`` attribute for the caller to locate.
+    """
+    result = await page.evaluate(
+        """([preferredTokens, deprioritizedTokens]) => {
+        let cache = window.__gtFiCache;
+        if (!cache) {
+            cache = window.__gtFiCache = { dirty: true, input: null, hasImage: false };
+            new MutationObserver(() => { cache.dirty = true; }).observe(
+                document.documentElement,
+                { subtree: true, childList: true, attributes: true, attributeFilter: ['type', 'accept'] },
+            );
+        }
+        if (cache.dirty) {
+            const score = (input) => {
+                const value = (input.getAttribute('accept') || '').toLowerCase();
+                if (preferredTokens.some(token => value.includes(token))) {
+                    return 2;
+                }
+                if (deprioritizedTokens.some(token => value.includes(token))) {
+                    return 0;
+                }
+                return 1;
+            };
+            let best = null;
+            let bestScore = -1;
+            document.querySelectorAll('input[type=file]').forEach((input) => {
+                const value = score(input);
+                if (value > bestScore) {
+                    bestScore = value;
+                    best = input;
+                }
+            });
+            cache.input = best;
+            cache.hasImage = bestScore === 2;
+            cache.dirty = false;
+        }
+        for (const el of document.querySelectorAll('[data-gt-file-input]')) {
+            if (el !== cache.input) {
+                el.removeAttribute('data-gt-file-input');
+            }
+        }
+        if (cache.input) {
+            cache.input.setAttribute('data-gt-file-input', '');
+        }
+        return [cache.input !== null, cache.hasImage];
+    }""",
+        [IMAGE_ACCEPT_TOKENS, DEPRIORITIZED_ACCEPT_TOKENS],
+    )
+    return result[0], result[1]
 
-    preferred_tokens = ("image", ".png", ".jpg", ".jpeg", ".webp", ".bmp", ".gif")
-    for handle in handles:
-        try:
-            accept_value = (await handle.get_attribute("accept")) or ""
-        except Exception:
-            accept_value = ""
-        value = accept_value.lower()
-        if any(token in value for token in preferred_tokens):
-            return True
 
-    return False
+async def _has_image_file_input(page) -> bool:
+    _, has_image = await _probe_file_inputs(page)
+    return has_image
 
 
 async def _open_image_translate(page, timeout_ms: int) -> None:
+    # Navigation itself should not inherit the full translation budget.
+    page.set_default_navigation_timeout(min(15000, timeout_ms))
+
     # Try direct URL first (more reliable)
-    direct_url = "https://translate.google.com/?sl=auto&tl=en&op=images"
     try:
-        await page.goto(direct_url, wait_until="domcontentloaded", timeout=min(30000, timeout_ms))
+        # Return as soon as the navigation commits and synchronize on the first
+        # useful element (file input or consent form) rather than the full load.
+        await page.goto(
+            IMAGE_TRANSLATE_URL, wait_until="commit", timeout=min(30000, timeout_ms)
+        )
+        await page.wait_for_function(
+            "(selector) => document.querySelector(selector)",
+            arg=READY_OR_CONSENT_SELECTOR,
+            timeout=min(30000, timeout_ms),
+        )
         await _natural_delay()
         await _dismiss_consent(page)
-        await _natural_delay()
-        
-        # Check if we're on the images page
-        if re.search(r"[?&]op=images", page.url) or await _has_image_file_input(page):
+
+        # The images UI is ready once its file input is attached; only fall
+        # back to the tab-click path when it never shows up.
+        await page.wait_for_selector(
+            "input[type=file]", state="attached", timeout=min(10000, timeout_ms)
+        )
+        if await _has_image_file_input(page):
             logger.debug("Successfully opened image translate via direct URL")
             return
     except Exception as e:
         logger.debug(f"Direct URL navigation failed: {e}, trying fallback")
 
     # Fallback: navigate to main page and click Images tab
-    await page.goto("https://translate.google.com/", wait_until="domcontentloaded")
+    await page.goto(TRANSLATE_HOME_URL, wait_until="domcontentloaded")
     await _natural_delay()
     await _dismiss_consent(page)
-    await _natural_delay()
 
-    candidates = [
-        page.get_by_role("tab", name=re.compile(r"images", re.I)),
-        page.get_by_role("button", name=re.compile(r"(image translation|images)", re.I)),
-        page.locator("button[aria-label='Image translation']"),
-        page.locator("button:has-text('Images')"),
-        page.locator("[data-value='images']"),
-        page.locator("a[href*='op=images']"),
-    ]
+    candidates = IMAGES_TAB_SELECTORS
 
-    for locator in candidates:
+    while candidates:
         try:
-            if await locator.count() == 0:
-                continue
-            await locator.first.click(timeout=timeout_ms)
-            try:
-                await page.wait_for_url(
-                    re.compile(r"[?&]op=images"), timeout=min(5000, timeout_ms)
-                )
-                await _natural_delay()
-                return
-            except PlaywrightTimeoutError:
-                if await _has_image_file_input(page):
-                    await _natural_delay()
-                    return
+            clicked = await _click_first_visible(page, candidates)
         except Exception:
-            continue
+            break
+        if clicked < 0:
+            break
+        try:
+            await page.wait_for_url(IMAGES_URL_RE, timeout=min(5000, timeout_ms))
+            return
+        except PlaywrightTimeoutError:
+            if await _has_image_file_input(page):
+                return
+        # That candidate did not open the images tab; try the remaining ones.
+        candidates = candidates[clicked + 1 :]
 
     try:
-        if re.search(r"[?&]op=images", page.url):
+        if IMAGES_URL_RE.search(page.url):
             return
     except Exception:
         pass
@@ -344,91 +492,84 @@ async def _open_image_translate(page, timeout_ms: int) -> None:
     raise RuntimeError("Could not open image translate page.")
 
 
-async def _dismiss_consent(page) -> None:
-    selectors = [
-        "button:has-text('Accept all')",
-        "button:has-text('I agree')",
-        "button:has-text('Agree')",
-        "button:has-text('Accept')",
-        "#introAgreeButton",
-        "button[aria-label='Accept all']",
-    ]
-
-    for selector in selectors:
-        try:
-            locator = page.locator(selector)
-            if await locator.count() > 0 and await locator.first.is_visible():
-                await locator.first.click(timeout=2000)
-                return
-        except Exception:
-            continue
-
-    for frame in page.frames:
-        for selector in selectors:
-            try:
-                locator = frame.locator(selector)
-                if await locator.count() > 0 and await locator.first.is_visible():
-                    await locator.first.click(timeout=2000)
-                    return
-            except Exception:
-                continue
-
-
-async def _find_download_button(page):
-    selectors = [
-        "button:has-text('Download')",
-        "a:has-text('Download')",
-        "button[aria-label*='Download']",
-        "a[aria-label*='Download']",
-    ]
-
-    for selector in selectors:
-        try:
-            locator = page.locator(selector)
-            if await locator.count() > 0 and await locator.first.is_visible():
-                return locator.first
-        except Exception:
-            continue
-
-    try:
-        locator = page.get_by_role("button", name=re.compile("download", re.I))
-        if await locator.count() > 0 and await locator.first.is_visible():
-            return locator.first
-    except Exception:
-        pass
+# In-page helpers shared by the single-evaluate probes below.
+_FIND_FIRST_VISIBLE_JS = """
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        const style = getComputedStyle(el);
+        return rect.width > 0 && rect.height > 0
+            && style.visibility !== 'hidden' && style.display !== 'none';
+    };
+    const findFirstVisible = (selectors, click) => {
+        for (const el of document.querySelectorAll('[data-gt-match]')) {
+            el.removeAttribute('data-gt-match');
+        }
+        for (let i = 0; i < selectors.length; i++) {
+            const [css, text] = selectors[i];
+            const needle = text ? text.toLowerCase() : null;
+            for (const el of document.querySelectorAll(css)) {
+                if (needle) {
+                    const label = `${el.getAttribute('aria-label') || ''} ${el.textContent || ''}`;
+                    if (!label.toLowerCase().includes(needle)) {
+                        continue;
+                    }
+                }
+                if (!isVisible(el)) {
+                    continue;
+                }
+                if (click) {
+                    el.click();
+                } else {
+                    el.setAttribute('data-gt-match', '');
+                }
+                return i;
+            }
+        }
+        return -1;
+    };
+"""
 
-    return None
 
+async def _click_first_visible(
+    frame, selectors: Sequence[tuple[str, Optional[str]]], *, click: bool = True
+) -> int:
+    """Find the first visible element matching ``selectors`` in one round trip.
 
-async def _pick_file_input(page) -> int:
-    handles = await page.query_selector_all("input[type=file]")
-    if not handles:
-        return -1
+    Each entry is a ``(css, text)`` pair; ``text`` optionally requires a
+    case-insensitive substring match on the element's text or aria-label.
+    The match is clicked in-page, or, with ``click=False``, tagged with a
+    ``data-gt-match`` attribute for the caller to locate. Returns the index
+    of the matching entry, or -1.
+    """
+    return await frame.evaluate(
+        "([selectors, click]) => {"
+        + _FIND_FIRST_VISIBLE_JS
+        + "return findFirstVisible(selectors, click); }",
+        [selectors, click],
+    )
 
-    preferred_tokens = ("image", ".png", ".jpg", ".jpeg", ".webp", ".bmp", ".gif")
-    deprioritized_tokens = (".pdf", ".pptx", ".docx", ".xlsx", "application/pdf")
 
-    def score(accept_value: str) -> int:
-        value = (accept_value or "").lower()
-        if any(token in value for token in preferred_tokens):
-            return 2
-        if any(token in value for token in deprioritized_tokens):
-            return 0
-        return 1
+async def _dismiss_consent(page) -> None:
+    # page.frames includes the main frame. Probe every frame at once without
+    # clicking, then click only the first hit in frame order so a consent
+    # button in one frame and a look-alike in another are never both pressed.
+    frames = page.frames
+    results = await asyncio.gather(
+        *(_click_first_visible(frame, CONSENT_SELECTORS, click=False) for frame in frames),
+        return_exceptions=True,
+    )
+    for frame, result in zip(frames, results):
+        if isinstance(result, int) and result >= 0:
+            try:
+                await frame.locator("[data-gt-match]").first.click(timeout=2000)
+            except Exception:
+                continue
+            return
 
-    best_idx = 0
-    best_score = -1
-    for idx, handle in enumerate(handles):
-        try:
-            accept_value = await handle.get_attribute("accept")
-        except Exception:
-            accept_value = ""
-        value_score = score(accept_value or "")
-        if value_score > best_score:
-            best_score = value_score
-            best_idx = idx
 
-    return best_idx
+async def _pick_file_input(page):
+    found, _ = await _probe_file_inputs(page)
+    return page.locator("[data-gt-file-input]").first if found else None
 
 
 async def _wait_for_translated_image_src(page, timeout_ms: int) -> str:
@@ -436,66 +577,168 @@ async def _wait_for_translated_image_src(page, timeout_ms: int) -> str:
     last_error = None
 
     while time.time() < deadline:
+        remaining_ms = max(0, int((deadline - time.time()) * 1000))
         try:
+            # Resolve in-page as soon as a candidate image appears or finishes
+            # loading, instead of re-scanning the DOM on a fixed interval.
             src = await page.evaluate(
-                """() => {
-                const imgs = Array.from(document.querySelectorAll('img'))
-                    .filter(img => img.src && img.naturalWidth > 50 && img.naturalHeight > 50)
-                    .map(img => ({
-                        src: img.src,
-                        alt: img.alt || '',
-                        aria: img.getAttribute('aria-label') || ''
-                    }));
-
-                if (!imgs.length) {
-                    return null;
-                }
-
-                const preferred = imgs.find(item => /translated|translation/i.test(`${item.alt} ${item.aria}`));
-                if (preferred) {
-                    return preferred.src;
+                """(timeoutMs) => new Promise((resolve) => {
+                const pick = () => {
+                    const imgs = Array.from(document.querySelectorAll('img'))
+                        .filter(img => img.src && img.naturalWidth > 50 && img.naturalHeight > 50)
+                        .map(img => ({
+                            src: img.src,
+                            alt: img.alt || '',
+                            aria: img.getAttribute('aria-label') || ''
+                        }));
+
+                    if (!imgs.length) {
+                        return null;
+                    }
+
+                    const preferred = imgs.find(item => /translated|translation/i.test(`${item.alt} ${item.aria}`));
+                    if (preferred) {
+                        return preferred.src;
+                    }
+
+                    return imgs[imgs.length - 1].src;
+                };
+
+                const initial = pick();
+                if (initial) {
+                    resolve(initial);
+                    return;
                 }
 
-                return imgs[imgs.length - 1].src;
-            }"""
+                let timer = null;
+                const finish = (value) => {
+                    observer.disconnect();
+                    document.removeEventListener('load', onChange, true);
+                    clearTimeout(timer);
+                    resolve(value);
+                };
+                const onChange = () => {
+                    const src = pick();
+                    if (src) {
+                        finish(src);
+                    }
+                };
+                const observer = new MutationObserver(onChange);
+                observer.observe(document.documentElement, {
+                    subtree: true,
+                    childList: true,
+                    attributes: true,
+                    attributeFilter: ['src', 'alt', 'aria-label'],
+                });
+                // Image loads (naturalWidth changes) do not trigger mutations.
+                document.addEventListener('load', onChange, true);
+                timer = setTimeout(() => finish(null), timeoutMs);
+            })""",
+                remaining_ms,
             )
             if src:
                 return src
         except Exception as exc:
             last_error = exc
 
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
 
     raise RuntimeError("Timed out waiting for translated image.") from last_error
 
 
-async def _wait_for_translation_ready(page, timeout_ms: int) -> None:
+async def _wait_for_dom_change(
+    page, timeout_ms: int, min_interval_ms: int = 0
+) -> None:
+    """Wait until the page DOM changes or an image loads, or ``timeout_ms`` passes.
+
+    A change never resolves the wait before ``min_interval_ms`` has elapsed,
+    so callers that re-scan the page per tick stay rate-limited on busy pages.
+    """
+    try:
+        await asyncio.wait_for(
+            page.evaluate(
+                """([timeoutMs, minIntervalMs]) => new Promise((resolve) => {
+            const start = performance.now();
+            let debounceTimer = null;
+            const finish = () => {
+                observer.disconnect();
+                document.removeEventListener('load', onChange, true);
+                clearTimeout(debounceTimer);
+                clearTimeout(capTimer);
+                resolve();
+            };
+            // Coalesce bursts of mutations so busy pages are not re-probed
+            // constantly, and never resolve before the minimum interval. The
+            // debounce is never pushed back, and the hard cap below is never
+            // cleared, so a constantly mutating page still resolves.
+            const onChange = () => {
+                if (debounceTimer === null) {
+                    const remaining = minIntervalMs - (performance.now() - start);
+                    debounceTimer = setTimeout(finish, Math.max(50, remaining));
+                }
+            };
+            const observer = new MutationObserver(onChange);
+            observer.observe(document.documentElement, {
+                subtree: true,
+                childList: true,
+                attributes: true,
+                characterData: true,
+            });
+            document.addEventListener('load', onChange, true);
+            const capTimer = setTimeout(finish, timeoutMs);
+        })""",
+                [timeout_ms, min_interval_ms],
+            ),
+            timeout=timeout_ms / 1000.0 + 1,
+        )
+    except asyncio.TimeoutError:
+        return
+    except Exception:
+        # Navigation tears down the execution context; let the caller re-probe.
+        await asyncio.sleep(timeout_ms / 1000.0)
+
+
+async def _wait_for_translation_ready(page, timeout_ms: int) -> tuple[str, Any]:
+    """Wait until the translation is ready and report which signal fired.
+
+    Returns ``("download_button", index)`` with the matching
+    ``DOWNLOAD_SELECTORS`` entry when a download button appears,
+    or ``("img", src)`` when the translated image can be read directly.
+    """
     deadline = time.time() + (timeout_ms / 1000.0)
     last_src = None
     stable_since = None
     last_error_text = None
 
     while time.time() < deadline:
-        button = await _find_download_button(page)
-        if button is not None:
-            return
-
+        # One evaluate per tick covers the download button, the translated
+        # image, UI error text and the fallback image candidate.
         try:
-            translated_img = page.locator(
-                "img[alt*='Translated' i], img[aria-label*='translation' i], img[aria-label*='translated' i]"
-            )
-            if await translated_img.count() > 0 and await translated_img.first.is_visible():
-                return
-        except Exception:
-            pass
+            result = await page.evaluate(
+                "([downloadSelectors, translatedSelector, errorMessages]) => {"
+                + _FIND_FIRST_VISIBLE_JS
+                + """
+                const download = findFirstVisible(downloadSelectors, false);
+
+                let translatedSrc = null;
+                const translated = document.querySelectorAll(translatedSelector);
+                for (const img of translated) {
+                    if (img.src && isVisible(img)) {
+                        translatedSrc = img.src;
+                        break;
+                    }
+                }
 
-        error_text = await _detect_translation_error(page)
-        if error_text:
-            last_error_text = error_text
+                const lower = ((document.body && document.body.innerText) || '').toLowerCase();
+                const hasDetect = lower.includes("can't detect text") || lower.includes('cannot detect text');
+                const hasLang = lower.includes('language may not be supported');
+                let error = null;
+                if (hasDetect && hasLang) {
+                    error = "Can't detect text. This language may not be supported.";
+                } else {
+                    error = errorMessages.find(message => lower.includes(message.toLowerCase())) || null;
+                }
 
-        try:
-            result = await page.evaluate(
-                """() => {
                 const imgs = Array.from(document.querySelectorAll('img'))
                     .filter(img => img.src && img.naturalWidth > 50 && img.naturalHeight > 50)
                     .map(img => ({
@@ -503,27 +746,35 @@ async def _wait_for_translation_ready(page, timeout_ms: int) -> None:
                         alt: img.alt || '',
                         aria: img.getAttribute('aria-label') || ''
                     }));
-
-                if (!imgs.length) {
-                    return { preferred: false, src: null };
-                }
-
-                const preferred = imgs.find(item => /translated|translation/i.test(`${item.alt} ${item.aria}`));
-                if (preferred) {
-                    return { preferred: true, src: preferred.src };
+                let preferred = false;
+                let src = null;
+                if (imgs.length) {
+                    const match = imgs.find(item => /translated|translation/i.test(`${item.alt} ${item.aria}`));
+                    preferred = Boolean(match);
+                    src = match ? match.src : imgs[imgs.length - 1].src;
                 }
 
-                return { preferred: false, src: imgs[imgs.length - 1].src };
-            }"""
+                return { download, translatedSrc, error, preferred, src };
+            }""",
+                [DOWNLOAD_SELECTORS, TRANSLATED_IMG_SELECTOR, TRANSLATION_ERROR_MESSAGES],
             )
         except Exception:
-            result = {"preferred": False, "src": None}
+            result = {}
+
+        if result.get("download", -1) >= 0:
+            return "download_button", result["download"]
+
+        if result.get("translatedSrc"):
+            return "img", result["translatedSrc"]
 
-        src = result.get("src") if isinstance(result, dict) else None
-        preferred = bool(result.get("preferred")) if isinstance(result, dict) else False
+        if result.get("error"):
+            last_error_text = result["error"]
+
+        src = result.get("src")
+        preferred = bool(result.get("preferred"))
 
         if preferred and src:
-            return
+            return "img", src
 
         if src:
             now = time.time()
@@ -531,12 +782,13 @@ async def _wait_for_translation_ready(page, timeout_ms: int) -> None:
                 if stable_since is None:
                     stable_since = now
                 elif now - stable_since >= 1.5:
-                    return
+                    return "img", src
             else:
                 last_src = src
                 stable_since = None
 
-        await asyncio.sleep(0.5)
+        # Each tick forces layout, so keep ticks at least 250 ms apart.
+        await _wait_for_dom_change(page, 500, min_interval_ms=250)
 
     if last_error_text:
         screenshot_path = await _capture_error_screenshot(page, "detect_text")
@@ -554,41 +806,55 @@ async def _wait_for_translation_ready(page, timeout_ms: int) -> None:
     raise RuntimeError("Timed out waiting for translation to finish.")
 
 
-
-
-async def _detect_translation_error(page) -> Optional[str]:
-    try:
-        body_text = await page.evaluate(
-            "() => (document.body && document.body.innerText) ? document.body.innerText : ''"
-        )
-    except Exception:
-        return None
-
-    if not body_text:
-        return None
-
-    lower = body_text.lower()
-    has_detect = "can't detect text" in lower or "cannot detect text" in lower
-    has_lang = "language may not be supported" in lower
-
-    if has_detect and has_lang:
-        return "Can't detect text. This language may not be supported."
-
-    for message in TRANSLATION_ERROR_MESSAGES:
-        if message.lower() in lower:
-            return message
-
-    return None
+async def _fetch_in_page_base64(page, url: str) -> str:
+    """Fetch ``url`` inside the page and return its body base64-encoded.
+
+    Reuses the page's session and loaded resources, and ships the body back in
+    a single evaluate result.
+    """
+    return await page.evaluate(
+        """async (url) => {
+        const response = await fetch(url);
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}`);
+        }
+        const blob = await response.blob();
+        // FileReader base64-encodes natively instead of building a binary
+        // string one byte at a time.
+        const dataUrl = await new Promise((resolve, reject) => {
+            const reader = new FileReader();
+            reader.onload = () => resolve(reader.result);
+            reader.onerror = () => reject(reader.error);
+            reader.readAsDataURL(blob);
+        });
+        return dataUrl.slice(dataUrl.indexOf(',') + 1);
+    }""",
+        url,
+    )
+
+
+def _download_button_locator(page, index: int):
+    """Build a locator for ``DOWNLOAD_SELECTORS[index]`` that survives re-renders."""
+    css, text = DOWNLOAD_SELECTORS[index]
+    locator = page.locator(css)
+    if text:
+        # Mirror the in-page probe: match on text content or aria-label.
+        locator = locator.filter(
+            has_text=re.compile(re.escape(text), re.IGNORECASE)
+        ).or_(locator.and_(page.locator(f"[aria-label*='{text}' i]")))
+    return locator.filter(visible=True).first
 
 
 async def _download_or_extract_image(
-    page, timeout_ms: int, download_path: Optional[str]
+    page, timeout_ms: int, download_path: Optional[str], ready: tuple[str, Any]
 ) -> bytes:
-    button = await _find_download_button(page)
-    if button is not None:
+    kind, value = ready
+    if kind == "download_button":
         try:
             async with page.expect_download(timeout=timeout_ms) as download_info:
-                await button.click()
+                await _download_button_locator(page, value).click(
+                    timeout=DOWNLOAD_CLICK_TIMEOUT_MS
+                )
             download = await download_info.value
             if download_path:
                 await download.save_as(download_path)
@@ -600,30 +866,23 @@ async def _download_or_extract_image(
                     return handle.read()
         except PlaywrightTimeoutError:
             pass
-
-    src = await _wait_for_translated_image_src(page, timeout_ms)
+        src = await _wait_for_translated_image_src(page, timeout_ms)
+    else:
+        src = value
 
     if src.startswith("data:"):
         _, encoded = src.split(",", 1)
         image_bytes = _normalize_base64(encoded)
     elif src.startswith("blob:"):
-        encoded = await page.evaluate(
-            """async (blobUrl) => {
-            const response = await fetch(blobUrl);
-            const buffer = await response.arrayBuffer();
-            let binary = '';
-            const bytes = new Uint8Array(buffer);
-            for (let i = 0; i < bytes.length; i++) {
-                binary += String.fromCharCode(bytes[i]);
-            }
-            return btoa(binary);
-        }""",
-            src,
-        )
-        image_bytes = _normalize_base64(encoded)
+        image_bytes = _normalize_base64(await _fetch_in_page_base64(page, src))
     elif src.startswith("http"):
-        response = await page.request.get(src, timeout=timeout_ms)
-        image_bytes = await response.body()
+        try:
+            image_bytes = _normalize_base64(await _fetch_in_page_base64(page, src))
+        except Exception as exc:
+            # Cross-origin hosts without CORS headers cannot be read in-page.
+            logger.debug(f"In-page fetch of translated image failed: {exc}")
+            response = await page.request.get(src, timeout=timeout_ms)
+            image_bytes = await response.body()
     else:
         raise RuntimeError("Could not capture translated image output.")
 
@@ -636,7 +895,7 @@ async def _download_or_extract_image(
 
 async def translate_image_google_async(
     *,
-    image_bytes: Optional[bytes] = None,
+    image_bytes: Optional[bytes | memoryview] = None,
     image_base64: Optional[str] = None,
     headless: bool = True,
     timeout_ms: int = DEFAULT_TIMEOUT_MS,
@@ -647,50 +906,83 @@ async def translate_image_google_async(
 
     if image_base64 is not None:
         image_bytes = _normalize_base64(image_base64)
+        if not image_bytes:
+            raise ValueError("Base64 input decoded to an empty image.")
 
     if image_bytes is None:
         raise ValueError("Image bytes were not provided.")
 
-    temp_path = _write_temp_image(image_bytes)
+    suffix, mime_type = _infer_upload_format(image_bytes)
     if download_path:
         download_path = _resolve_work_path(download_path)
 
-    try:
-        pool = await get_browser_pool()
-        async with pool.acquire() as context:
-            page = await context.new_page()
-            page.set_default_timeout(timeout_ms)
+    pool = await get_browser_pool()
+    async with pool.acquire() as page:
+        page.set_default_timeout(timeout_ms)
 
+        if not await _has_image_file_input(page):
             await _open_image_translate(page, timeout_ms)
 
-            await page.wait_for_selector(
-                "input[type=file]", state="attached", timeout=timeout_ms
-            )
-            await _natural_delay()
-            file_input_index = await _pick_file_input(page)
-            if file_input_index < 0:
-                raise RuntimeError("No file input found on translate page.")
-            await page.locator("input[type=file]").nth(file_input_index).set_input_files(
-                temp_path,
-                timeout=timeout_ms,
-            )
-            await _natural_delay()
+        await page.wait_for_selector(
+            "input[type=file]", state="attached", timeout=timeout_ms
+        )
+        await _natural_delay()
+        file_input = await _pick_file_input(page)
+        if file_input is None:
+            raise RuntimeError("No file input found on translate page.")
+        # Upload straight from memory instead of round-tripping through a temp file.
+        await file_input.set_input_files(
+            {
+                "name": f"image{suffix}",
+                "mimeType": mime_type,
+                "buffer": image_bytes,
+            },
+            timeout=timeout_ms,
+        )
 
-            try:
-                await page.wait_for_load_state("networkidle", timeout=timeout_ms)
-            except PlaywrightTimeoutError:
-                pass
-            await _natural_delay()
+        ready = await _wait_for_translation_ready(page, timeout_ms)
 
-            await _wait_for_translation_ready(page, timeout_ms)
-            await _natural_delay()
+        return await _download_or_extract_image(page, timeout_ms, download_path, ready)
 
-            return await _download_or_extract_image(page, timeout_ms, download_path)
-    finally:
-        try:
-            os.remove(temp_path)
-        except OSError:
-            pass
+
+async def translate_images_google_async(
+    images: Iterable[bytes | memoryview],
+    *,
+    concurrency: Optional[int] = None,
+    **kwargs,
+) -> list[bytes | BaseException]:
+    """Translate many images concurrently against the shared browser pool.
+
+    ``concurrency`` defaults to the pool size. Results are returned in input
+    order; a failed image yields its exception instead of raising.
+    """
+    semaphore = asyncio.Semaphore(concurrency or settings.browser_pool_size)
+
+    async def _one(image_bytes: bytes | memoryview) -> bytes:
+        async with semaphore:
+            return await translate_image_google_async(image_bytes=image_bytes, **kwargs)
+
+    return await asyncio.gather(
+        *(_one(image_bytes) for image_bytes in images), return_exceptions=True
+    )
+
+
+# Long-lived event loop backing the sync wrapper, so the browser pool (which is
+# bound to the loop it was started on) survives across calls.
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_lock = threading.Lock()
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    global _sync_loop
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="translate-image-google", daemon=True
+            ).start()
+            _sync_loop = loop
+        return _sync_loop
 
 
 def translate_image_google(*args, **kwargs) -> bytes:
@@ -705,4 +997,7 @@ def translate_image_google(*args, **kwargs) -> bytes:
             "Use translate_image_google_async instead."
         )
 
-    return asyncio.run(translate_image_google_async(*args, **kwargs))
+    future = asyncio.run_coroutine_threadsafe(
+        translate_image_google_async(*args, **kwargs), _get_sync_loop()
+    )
+    return future.result()
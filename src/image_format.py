@@ -0,0 +1,35 @@
+"""Magic-byte image format detection shared by the API and the browser client."""
+
+from __future__ import annotations
+
+FORMAT_TABLE = {
+    "jpeg": (".jpg", "image/jpeg"),
+    "png": (".png", "image/png"),
+    "gif": (".gif", "image/gif"),
+    "bmp": (".bmp", "image/bmp"),
+    "webp": (".webp", "image/webp"),
+}
+UNKNOWN_FORMAT = (".png", "application/octet-stream")
+
+
+def infer_format(image_bytes: bytes | memoryview) -> str:
+    """Detect the image format from its leading magic bytes."""
+    head = bytes(image_bytes[:12])
+    if head.startswith(b"\xff\xd8\xff"):
+        return "jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if head.startswith((b"GIF87a", b"GIF89a")):
+        return "gif"
+    if head.startswith(b"BM"):
+        return "bmp"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    return ""
+
+
+def infer_format_ext_media(image_bytes: bytes | memoryview) -> tuple[str, str, str]:
+    """Return ``(format, extension, media_type)`` from a single format probe."""
+    fmt = infer_format(image_bytes)
+    ext, media_type = FORMAT_TABLE.get(fmt, UNKNOWN_FORMAT)
+    return fmt, ext, media_type